@@ -11,9 +11,8 @@ import requests  # type: ignore
 import traceback
 import time
 from functools import lru_cache
-from typing import Dict, Optional, Tuple, Union
-from .util import log_info
-from deepl import util
+from typing import Dict, MutableMapping, Optional, Tuple, Union
+from . import util
 import json as json_module
 
 
@@ -21,6 +20,10 @@ user_agent = None
 max_network_retries = 5
 min_connection_timeout = 10.0
 
+# orjson serializes JSON payloads several times faster than the stdlib json
+# module used by requests; it is used if installed.
+_orjson = util._optional_import("orjson")
+
 
 class _BackoffTimer:
     """Implements exponential-backoff strategy.
@@ -99,7 +102,7 @@ class HttpClient:
         url: str,
         data: Optional[dict],
         json: Optional[dict],
-        headers: dict,
+        headers: MutableMapping,
         stream: bool = False,
         **kwargs,
     ) -> Tuple[int, Union[str, requests.Response]]:
@@ -131,11 +134,11 @@ class HttpClient:
                     raise exception  # type: ignore[misc]
 
             if exception is not None:
-                log_info(
+                util.log_info(
                     f"Encountered a retryable-exception: {str(exception)}"
                 )
 
-            log_info(
+            util.log_info(
                 f"Starting retry {backoff.get_num_retries() + 1} for request "
                 f"{method} {url} after sleeping for "
                 f"{backoff.get_time_until_deadline():.2f} seconds."
@@ -148,7 +151,7 @@ class HttpClient:
         url: str,
         data: Optional[dict],
         json: Optional[dict],
-        headers: dict,
+        headers: MutableMapping,
         stream: bool = False,
         **kwargs,
     ) -> Tuple[int, Union[str, requests.Response]]:
@@ -216,7 +219,7 @@ class HttpClient:
         url: str,
         data: Optional[dict],
         json: Optional[dict],
-        headers: dict,
+        headers: MutableMapping,
         **kwargs,
     ) -> requests.PreparedRequest:
         try:
@@ -230,8 +233,11 @@ class HttpClient:
                 ),
             )
 
+            if json is not None and _orjson is not None:
+                data = _orjson.dumps(json)  # type: ignore[assignment]
+                headers["Content-Type"] = "application/json"
             # TODO review when minimum Python version is raised
-            if tuple(map(int, requests.__version__.split("."))) >= (2, 4, 2):
+            elif tuple(map(int, requests.__version__.split("."))) >= (2, 4, 2):
                 kwargs["json"] = json
             elif json is not None:
                 # This is fine, see official docs
@@ -24,6 +24,7 @@ from .exceptions import (
     AuthorizationException,
     DocumentTranslationException,
 )
+import collections
 import http
 import http.client
 import json as json_module
@@ -37,6 +38,7 @@ from typing import (
     Dict,
     Iterable,
     List,
+    MutableMapping,
     Optional,
     TextIO,
     Tuple,
@@ -133,10 +135,10 @@ class Translator:
         util.log_info("Request to DeepL API", method=method, url=url)
         util.log_debug("Request details", data=data, json=json)
 
-        if headers is None:
-            headers = dict()
-        headers.update(
-            {k: v for k, v in self.headers.items() if k not in headers}
+        # Request-specific headers take precedence over the translator
+        # headers; ChainMap layers them without copying either dict.
+        headers_map: MutableMapping[str, str] = collections.ChainMap(
+            headers if headers is not None else {}, self.headers
         )
 
         status_code, content = self._client.request_with_backoff(
@@ -145,7 +147,7 @@ class Translator:
             data=data,
             json=json,
             stream=stream,
-            headers=headers,
+            headers=headers_map,
             **kwargs,
         )
 
@@ -434,12 +436,11 @@ class Translator:
 
         def join_tags(tag_argument: Union[str, Iterable[str]]) -> List[str]:
             if isinstance(tag_argument, str):
-                tag_argument = [tag_argument]
-            return [
-                tag
-                for arg_string in tag_argument
-                for tag in arg_string.split(",")
-            ]
+                return tag_argument.split(",")
+            # Materialize to distinguish an empty iterable (which must stay
+            # []) from [""], as both join to "" but [""] splits to [""]
+            tags = list(tag_argument)
+            return ",".join(tags).split(",") if tags else []
 
         if non_splitting_tags is not None:
             request_data["non_splitting_tags"] = join_tags(non_splitting_tags)
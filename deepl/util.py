@@ -1,13 +1,23 @@
 # Copyright 2022 DeepL SE (https://www.deepl.com)
 # Use of this source code is governed by an MIT
 # license that can be found in the LICENSE file.
+import datetime
 import importlib
-import itertools
 import logging
 from typing import Dict, Optional
 
 logger = logging.getLogger("deepl")
 
+# Deletion table for the characters disallowed in glossary terms:
+# C0 and C1 control characters and the Unicode line/paragraph separators
+_invalid_term_characters = str.maketrans(
+    "",
+    "",
+    "".join(map(chr, range(0, 32)))
+    + "".join(map(chr, range(128, 160)))
+    + "  ",
+)
+
 
 def _optional_import(module_name: str):
     """Tries importing the specified module and returns it if successful,
@@ -57,6 +67,27 @@ def get_int_safe(d: Optional[dict], key: str) -> Optional[int]:
         return None
 
 
+def parse_timestamp(timestamp: str) -> datetime.datetime:
+    """Parses a timestamp in the fixed format used by the DeepL API, for
+    example "2021-08-03T08:59:16.969Z".
+
+    :param timestamp: string containing the timestamp to parse.
+    :return: timezone-aware datetime.
+    """
+    try:
+        # fromisoformat (Python 3.7+) is much faster than strptime, but only
+        # accepts the "Z" UTC suffix from Python 3.11
+        if timestamp.endswith("Z"):
+            timestamp = timestamp[:-1] + "+00:00"
+        return datetime.datetime.fromisoformat(timestamp)
+    except (AttributeError, ValueError):
+        pass
+    # Workaround for bugs in strptime() in Python 3.6
+    if ":" == timestamp[-3:-2]:
+        timestamp = timestamp[:-3] + timestamp[-2:]
+    return datetime.datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%S.%f%z")
+
+
 def auth_key_is_free_account(auth_key: str) -> bool:
     """Returns True if the given authentication key belongs to a DeepL API Free
     account, otherwise False."""
@@ -71,14 +102,9 @@ def validate_glossary_term(term: str) -> None:
     found."""
     if len(term) == 0:
         raise ValueError(f'Term "{term}" is not a valid string')
-    if any(
-        (
-            0 <= ord(char) <= 31  # C0 control characters
-            or 128 <= ord(char) <= 159  # C1 control characters
-            or char in "\u2028\u2029"  # Unicode newlines
-        )
-        for char in term
-    ):
+    # str.translate() deletes disallowed characters at C speed, so comparing
+    # the result with the original detects them without a per-character loop
+    if term.translate(_invalid_term_characters) != term:
         raise ValueError(f'Term "{term}" contains invalid character')
 
 
@@ -95,7 +121,7 @@ def convert_tsv_to_dict(
     :return: dictionary containing parsed entries.
     """
     entries_dict = {}
-    for line, index in zip(tsv.splitlines(), itertools.count(1)):
+    for index, line in enumerate(tsv.splitlines(), start=1):
         if not line:
             continue
         if term_separator not in line:
@@ -5,59 +5,99 @@
 import deepl
 import json
 import logging
-from typing import Any, Callable, List, Tuple
+from typing import Any, Dict, List, Tuple
 from collections.abc import Iterable
 
-from deepl.translator import TextResult
+from deepl.util import _optional_import
+
+# orjson parses and serializes JSON considerably faster than the stdlib
+# json module; it is used if installed.
+_orjson = _optional_import("orjson")
+
+if _orjson is not None:
+
+    def _loads(json_str: str) -> Any:
+        return _orjson.loads(json_str)
+
+    def _dumps(obj: Any) -> str:
+        return _orjson.dumps(obj).decode("utf-8")
+
+else:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False)
 
 
 def batch_translate(
-    input_handler_pairs: List[Tuple[str, Callable[[deepl.TextResult], None]]],
+    texts: List[str],
+    targets: List[Tuple[Any, Any]],
     target_lang: str,
     translator: deepl.Translator,
     **kwargs,
 ) -> None:
     """
-    Takes a list of translation inputs and result handlers, translates all
-    inputs and calls each handler with the translation results.
+    Takes parallel lists of translation inputs and (container, key)
+    targets, translates all inputs and stores each translation at its
+    target location.
+
+    Identical input strings are translated only once; documents with
+    repeated strings are billed for each distinct string.
     """
-    inputs = [input_str for input_str, _ in input_handler_pairs]
-    handlers = [handler for _, handler in input_handler_pairs]
+    unique_indices: Dict[str, int] = {}
+    unique_texts: List[str] = []
+    indices = []
+    for text in texts:
+        index = unique_indices.get(text)
+        if index is None:
+            index = len(unique_texts)
+            unique_indices[text] = index
+            unique_texts.append(text)
+        indices.append(index)
+
     results = translator.translate_text(
-        inputs, target_lang=target_lang, **kwargs
+        unique_texts, target_lang=target_lang, **kwargs
     )
     assert isinstance(results, list)
-    for result, handler in zip(results, handlers):
-        handler(result)
+    for index, (container, key) in zip(indices, targets):
+        container[key] = results[index].text
 
 
 def parse_json_for_translation(
     obj: Any,
-    translation_candidates: List[
-        Tuple[str, Callable[[deepl.TextResult], None]]
-    ],
+    texts: List[str],
+    targets: List[Tuple[Any, Any]],
 ):
     """
-    Steps into the given JSON object and adds all strings to
-    translation candidates list
+    Steps into the given JSON object and adds all strings to the parallel
+    texts and (container, key) targets lists
     """
 
-    keys: Iterable = []
-    if type(obj) is dict:
-        keys = obj.keys()
-    elif type(obj) is list:
-        keys = range(len(obj))
-    else:
-        return
-
-    for key in keys:
-        if type(obj[key]) is str:
-            current_obj = obj
-            current_key = key
-            assign = lambda val: current_obj.__setitem__(current_key, val.text)
-            translation_candidates.append((obj[key], assign))
+    # Bind frequently-used names to locals: LOAD_FAST is cheaper than
+    # LOAD_GLOBAL/LOAD_METHOD in this hot loop over every JSON node.
+    _dict, _list, _str = dict, list, str
+    append_text = texts.append
+    append_target = targets.append
+
+    stack = [obj]
+    push = stack.append
+    while stack:
+        container = stack.pop()
+        keys: Iterable
+        if type(container) is _dict:
+            keys = container.keys()
+        elif type(container) is _list:
+            keys = range(len(container))
         else:
-            parse_json_for_translation(obj[key], translation_candidates)
+            continue
+
+        for key in keys:
+            value = container[key]
+            if type(value) is _str:
+                append_text(value)
+                append_target((container, key))
+            else:
+                push(value)
 
 
 def translate_json(
@@ -80,22 +120,19 @@ def translate_json(
     """
 
     logger = logging.getLogger("deepl")
-    obj = json.loads(json_input)
+    obj = _loads(json_input)
     # Wrap the JSON object in an array, in case the input is a string
     obj = [obj]
 
     # Find all text in the JSON that is to be translated
-    translation_candidates: List[
-        Tuple[str, Callable[[deepl.TextResult], None]]
-    ] = []
-    parse_json_for_translation(obj, translation_candidates)
-    logger.info(
-        f"Found {len(translation_candidates)} strings to be translated"
-    )
+    texts: List[str] = []
+    targets: List[Tuple[Any, Any]] = []
+    parse_json_for_translation(obj, texts, targets)
+    logger.info(f"Found {len(texts)} strings to be translated")
 
     # Translate all texts
-    batch_translate(translation_candidates, target_lang, translator, **kwargs)
+    batch_translate(texts, targets, target_lang, translator, **kwargs)
     logger.info("Translation complete")
 
     # Unwrap the dummy array and convert to JSON
-    return json.dumps(obj[0])
+    return _dumps(obj[0])
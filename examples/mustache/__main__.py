@@ -3,6 +3,7 @@
 # license that can be found in the LICENSE file.
 
 import argparse
+import concurrent.futures
 import deepl
 import os
 
@@ -76,15 +77,23 @@ def main():
     translator = deepl.Translator(auth_key, server_url=server_url)
     translator.get_usage()
 
-    for template in args.template:
+    def translate_template(template):
         # Call translate_mustache() to translate the Mustache template
-        output = translate_mustache(
+        return translate_mustache(
             template,
             translator=translator,
             source_lang=args.source_lang,
             target_lang=args.target_lang,
         )
-        print(output)
+
+    # Translate the templates in parallel; each translation is a blocking
+    # API call, so threads overlap the network round-trips. executor.map
+    # preserves the input order of the templates.
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(8, len(args.template))
+    ) as executor:
+        for output in executor.map(translate_template, args.template):
+            print(output)
 
 
 if __name__ == "__main__":
@@ -2,10 +2,16 @@
 # Use of this source code is governed by an MIT
 # license that can be found in the LICENSE file.
 
+from functools import lru_cache
 from html.parser import HTMLParser
 import html
+import re
 from typing import List, Tuple, Dict
 
+# Attribute values repeat heavily in real markup (class names, ids),
+# so escaping results are memoized.
+_escape = lru_cache(maxsize=None)(html.escape)
+
 
 class PassthroughHTMLParser(HTMLParser):
     """
@@ -18,13 +24,13 @@ class PassthroughHTMLParser(HTMLParser):
 
     def __init__(self):
         super().__init__(convert_charrefs=False)
-        self._result = ""
+        self._parts: List[str] = []
 
     def parsed(self):
-        return self._result
+        return "".join(self._parts)
 
     def _append(self, text):
-        self._result += text
+        self._parts.append(text)
 
     def handle_startendtag(self, tag, attrs):
         self._append(f"<{tag}{self._encode_attrs(attrs)} />")
@@ -57,16 +63,32 @@ class PassthroughHTMLParser(HTMLParser):
     def _encode_attrs(attrs: List[Tuple[str, str]]) -> str:
         if attrs:
             return " " + " ".join(
-                f'{key}="{html.escape(value)}"' for key, value in attrs
+                f'{key}="{_escape(value)}"' for key, value in attrs
             )
         else:
             return ""
 
 
-class TagReplacerHTMLParser(PassthroughHTMLParser):
+# Matches a self-closing tag, capturing the tag name and attribute text
+_SELF_CLOSING_TAG_RE = re.compile(
+    r"<\s*([a-zA-Z][\w-]*)"
+    r"((?:\s+[\w-]+\s*=\s*(?:\"[^\"]*\"|'[^']*'|[^\s>]+))*)"
+    r"\s*/\s*>"
+)
+# Matches the id attribute within the attribute text of a tag
+_ID_ATTR_RE = re.compile(r"\bid\s*=\s*(?:\"([^\"]*)\"|'([^']*)'|([^\s>]+))")
+
+
+class TagReplacerHTMLParser:
     """
-    An HTML parser that accumulates parsed HTML unmodified, except that
-    matching start-end tags are replaced by prepared content.
+    Replaces matching self-closing tags with prepared content, leaving all
+    other markup untouched.
+
+    Only self-closing tags need to be matched, so instead of parsing with
+    html.parser.HTMLParser and re-serializing everything, a compiled regular
+    expression scans the markup in a single pass. The full markup should be
+    given in one feed() call, because tags split across calls are not
+    matched.
 
     :param replace_tags: A dictionary of tags to replace, with keys matching
         tag names ("tag") or tag names with IDs ("tag#id"), and values the text
@@ -74,23 +96,31 @@ class TagReplacerHTMLParser(PassthroughHTMLParser):
     """
 
     def __init__(self, replace_tags: Dict[str, str]):
-        super().__init__()
         self._replace_tags = replace_tags
+        self._parts: List[str] = []
 
-    def handle_startendtag(self, tag, attrs):
-        if self._replace_tag_if_matching(tag):
-            return
-
-        id = next((value for key, value in attrs if key == "id"), None)
-        if id is not None and self._replace_tag_if_matching(f"{tag}#{id}"):
-            return
-
-        # If no replacement is found, fall back to passthrough parser
-        super().handle_starttag(tag, attrs)
-
-    def _replace_tag_if_matching(self, tag_and_id):
-        if tag_and_id in self._replace_tags:
-            stored_tag = self._replace_tags[tag_and_id]
-            self._append(stored_tag)
-            return True
-        return False
+    def feed(self, text: str):
+        self._parts.append(_SELF_CLOSING_TAG_RE.sub(self._replace_match, text))
+
+    def close(self):
+        pass
+
+    def parsed(self):
+        return "".join(self._parts)
+
+    def _replace_match(self, match: "re.Match") -> str:
+        tag = match.group(1)
+        if tag in self._replace_tags:
+            return self._replace_tags[tag]
+
+        id_match = _ID_ATTR_RE.search(match.group(2))
+        if id_match is not None:
+            id = next(
+                group for group in id_match.groups() if group is not None
+            )
+            replacement = self._replace_tags.get(f"{tag}#{id}")
+            if replacement is not None:
+                return replacement
+
+        # If no replacement is found, keep the tag unchanged
+        return match.group(0)
@@ -6,6 +6,7 @@ from deepl.translator import TextResult
 from html_parsing import TagReplacerHTMLParser
 import deepl
 import logging
+import re
 from typing import Dict, Iterator, List, Optional, Tuple
 
 
@@ -20,29 +21,25 @@ def tokenize_mustache(
     :param delimiters: List of left and right delimiters identifying Mustache
         tags.
     """
-    literal = ""
-    while template:
-        # Find the next Mustache tag
-        for ldel, rdel in delimiters:
-            if not template.startswith(ldel):
-                continue
-            rpos = template.find(rdel, len(ldel))
-            if rpos == -1:
-                continue
-            rpos += len(rdel)
-
-            yield "literal", literal
-            literal = ""
-            yield "tag", template[0:rpos]
-            template = template[rpos:]
-            break
-        else:
-            # Template does not begin with tag, append to literal
-            literal += template[0]
-            template = template[1:]
+    # The alternation preserves the order-of-precedence of the delimiters;
+    # re.compile results are cached by the re module, so repeated calls with
+    # the same delimiters reuse the compiled pattern.
+    tag_pattern = re.compile(
+        "|".join(
+            re.escape(ldel) + ".*?" + re.escape(rdel)
+            for ldel, rdel in delimiters
+        ),
+        re.DOTALL,
+    )
 
-    if literal:
-        yield "literal", literal
+    literal_start = 0
+    for match in tag_pattern.finditer(template):
+        yield "literal", template[literal_start : match.start()]
+        yield "tag", match.group(0)
+        literal_start = match.end()
+
+    if literal_start < len(template):
+        yield "literal", template[literal_start:]
 
 
 def convert_mustache_to_xml(
@@ -58,7 +55,7 @@ def convert_mustache_to_xml(
         tags.
     :return XML and dictionary of replaced tags.
     """
-    xml = ""
+    xml_parts = []
     id_counter = 0
     extracted_tokens = {}
 
@@ -67,12 +64,12 @@ def convert_mustache_to_xml(
         if tag_type == "tag":
             tag_id = str(id_counter)
             id_counter += 1
-            xml += f"<{placeholder_tag} id={tag_id} />"
+            xml_parts.append(f"<{placeholder_tag} id={tag_id} />")
             extracted_tokens[f"{placeholder_tag}#{tag_id}"] = tag_content
         else:
-            xml += tag_content
+            xml_parts.append(tag_content)
 
-    return xml, extracted_tokens
+    return "".join(xml_parts), extracted_tokens
 
 
 def translate_mustache(
@@ -121,6 +118,11 @@ def translate_mustache(
     assert isinstance(result, TextResult)
     logger.info("Translated XML: %s", result.text)
 
+    # Without extracted tags there is nothing to reinsert, so the
+    # replacement pass over the translated text can be skipped entirely
+    if not replaced_tags:
+        return result.text
+
     # Reinsert the extracted Mustache tags in the translated XML
     xml_parser = TagReplacerHTMLParser(replaced_tags)
     xml_parser.feed(result.text)
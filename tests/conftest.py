@@ -2,11 +2,13 @@
 # Use of this source code is governed by an MIT
 # license that can be found in the LICENSE file.
 
+import collections
+import concurrent.futures
 import deepl
 import os
-import pathlib
-from pydantic import BaseSettings
 import pytest
+import socket
+import urllib.parse
 from typing import Callable, Optional
 from typing_extensions import Protocol
 import uuid
@@ -26,20 +28,30 @@ import uuid
 #      - auth_key can be set empty
 #  - using a real server with different IP (e.g. for testing)
 #      - user needs to configure their auth_key and server_url
-class Config(BaseSettings):
-    auth_key: Optional[str] = None
-    server_url: Optional[str] = None
-    mock_server_port: Optional[int] = None
-    proxy_url: Optional[str] = None
-    mock_proxy_server_port: Optional[int] = None
+class Config:
+    def __init__(self):
+        self.auth_key = os.getenv("DEEPL_AUTH_KEY")
+        self.server_url = os.getenv("DEEPL_SERVER_URL")
+        self.mock_server_port = self._get_int("DEEPL_MOCK_SERVER_PORT")
+        self.proxy_url = os.getenv("DEEPL_PROXY_URL")
+        self.mock_proxy_server_port = self._get_int(
+            "DEEPL_MOCK_PROXY_SERVER_PORT"
+        )
 
-    class Config:
-        env_prefix = "DEEPL_"
+    @staticmethod
+    def _get_int(name: str) -> Optional[int]:
+        value = os.getenv(name)
+        return int(value) if value else None
 
 
-@pytest.fixture
+# The environment does not change while tests run, so the settings are
+# read once at import time and shared by all fixtures and skip marks.
+_config = Config()
+
+
+@pytest.fixture(scope="session")
 def config():
-    return Config()
+    return _config
 
 
 @pytest.fixture
@@ -51,7 +63,7 @@ def server(config):
             if self.is_mock_server:
                 self.server_url = config.server_url
                 self.auth_key = "mock_server"
-                uu = str(uuid.uuid1())
+                uu = str(uuid.uuid4())
                 session_uuid = f"{os.getenv('PYTEST_CURRENT_TEST')}/{uu}"
                 self.headers["mock-server-session"] = session_uuid
                 self.proxy = config.proxy_url
@@ -140,13 +152,14 @@ def _make_translator(server, auth_key=None, proxy=None):
         auth_key, server_url=server.server_url, proxy=proxy
     )
 
-    # If the server test fixture has custom headers defined, update the
-    # translator headers and replace with the server headers dictionary.
-    # Note: changing the underlying object is necessary because some tests
-    # make changes to the headers during tests.
+    # If the server test fixture has custom headers defined, layer them over
+    # the translator headers without copying.
+    # Note: keeping the server headers dictionary live is necessary because
+    # some tests make changes to the headers during tests.
     if server.headers:
-        server.headers.update(translator.headers)
-        translator.headers = server.headers
+        translator.headers = collections.ChainMap(
+            server.headers, translator.headers
+        )
     return translator
 
 
@@ -159,16 +172,51 @@ def _make_deepl_client(server, auth_key=None, proxy=None):
         auth_key, server_url=server.server_url, proxy=proxy
     )
 
-    # If the server test fixture has custom headers defined, update the
-    # translator headers and replace with the server headers dictionary.
-    # Note: changing the underlying object is necessary because some tests
-    # make changes to the headers during tests.
+    # If the server test fixture has custom headers defined, layer them over
+    # the translator headers without copying.
+    # Note: keeping the server headers dictionary live is necessary because
+    # some tests make changes to the headers during tests.
     if server.headers:
-        server.headers.update(deepl_client.headers)
-        deepl_client.headers = server.headers
+        deepl_client.headers = collections.ChainMap(
+            server.headers, deepl_client.headers
+        )
     return deepl_client
 
 
+# Read-only tests do not mutate translator or server-session state, so one
+# translator — and therefore one connection-pooled requests.Session — can
+# serve the whole test run.
+@pytest.fixture(scope="session")
+def shared_translator(config):
+    if config.mock_server_port is not None:
+        auth_key = "mock_server"
+    else:
+        auth_key = config.auth_key
+    translator = deepl.Translator(auth_key, server_url=config.server_url)
+    if config.mock_server_port is not None:
+        translator.headers[
+            "mock-server-session"
+        ] = f"shared-translator/{uuid.uuid4()}"
+    return translator
+
+
+# The language listings are static for the duration of a test run, so each
+# endpoint is queried at most once per session.
+@pytest.fixture(scope="session")
+def source_languages(shared_translator):
+    return shared_translator.get_source_languages()
+
+
+@pytest.fixture(scope="session")
+def target_languages(shared_translator):
+    return shared_translator.get_target_languages()
+
+
+@pytest.fixture(scope="session")
+def glossary_languages(shared_translator):
+    return shared_translator.get_glossary_languages()
+
+
 @pytest.fixture
 def translator(server):
     """Returns a deepl.Translator to use in all tests taking a parameter
@@ -189,7 +237,7 @@ def deepl_client(server):
 def translator_with_random_auth_key(server):
     """Returns a deepl.Translator with randomized authentication key,
     for use in mock-server tests."""
-    return _make_translator(server, auth_key=str(uuid.uuid1()))
+    return _make_translator(server, auth_key=str(uuid.uuid4()))
 
 
 @pytest.fixture
@@ -197,16 +245,22 @@ def translator_with_random_auth_key_and_proxy(server):
     """Returns a deepl.Translator with randomized authentication key,
     for use in mock-server tests."""
     return _make_translator(
-        server, auth_key=str(uuid.uuid1()), proxy=server.proxy
+        server, auth_key=str(uuid.uuid4()), proxy=server.proxy
     )
 
 
+# Cleanup predicates registered via cleanup_matching_glossaries; the
+# session-end sweep below lists glossaries once and evaluates all of them,
+# so individual tests pay no list-glossaries round-trip.
+_glossary_cleanup_registry: list = []
+
+
 @pytest.fixture
 def cleanup_matching_glossaries(translator):
     """
     Fixture function to remove all glossaries from the server matching the
     given predicate. Can be used, for example, to remove all glossaries with a
-    matching name.
+    matching name. Removal is deferred to a single sweep at session end.
 
     Usage example:
         def test_example(cleanup_matching_glossaries):
@@ -217,17 +271,56 @@ def cleanup_matching_glossaries(translator):
     """
 
     def do_cleanup(predicate: Callable[[deepl.GlossaryInfo], bool]):
-        glossaries = translator.list_glossaries()
-        for glossary in glossaries:
-            if predicate(glossary):
-                try:
-                    translator.delete_glossary(glossary)
-                except deepl.DeepLException:
-                    pass
+        _glossary_cleanup_registry.append((translator, predicate))
 
     return do_cleanup
 
 
+def _sweep_registered_glossaries():
+    if not _glossary_cleanup_registry:
+        return
+    # All registered translators share the server auth key, so one of them
+    # can list and delete every matching glossary
+    translator = _glossary_cleanup_registry[0][0]
+    try:
+        glossaries = translator.list_glossaries()
+    except deepl.DeepLException:
+        return
+    matching = [
+        glossary
+        for glossary in glossaries
+        if any(
+            predicate(glossary) for _, predicate in _glossary_cleanup_registry
+        )
+    ]
+    if not matching:
+        return
+
+    def delete_ignoring_errors(glossary):
+        try:
+            translator.delete_glossary(glossary)
+        except deepl.DeepLException:
+            pass
+
+    # Deletions are independent API calls, so issue them in parallel
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(8, len(matching))
+    ) as executor:
+        list(executor.map(delete_ignoring_errors, matching))
+
+
+# Executor for test-glossary deletions, so tests do not wait for the
+# delete API call to finish. pytest_sessionfinish drains it below.
+_glossary_cleanup_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=4
+)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    _sweep_registered_glossaries()
+    _glossary_cleanup_executor.shutdown(wait=True)
+
+
 class ManagedGlossary:
     """
     Utility content-manager class to create a test glossary and ensure its
@@ -250,7 +343,7 @@ class ManagedGlossary:
     def __enter__(self) -> deepl.GlossaryInfo:
         return self._created_glossary
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
+    def _delete_ignoring_errors(self):
         try:
             self._translator.delete_glossary(
                 self._created_glossary.glossary_id
@@ -258,6 +351,11 @@ class ManagedGlossary:
         except deepl.DeepLException:
             pass
 
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        # The test does not depend on the deletion result, so run it in the
+        # background and let the session-finish hook wait for completion
+        _glossary_cleanup_executor.submit(self._delete_ignoring_errors)
+
 
 class CreateManagedGlossaryFunc(Protocol):
     """Helper class for type hints."""
@@ -311,28 +409,27 @@ def glossary_manager(translator, glossary_name) -> CreateManagedGlossaryFunc:
 def glossary_name(request) -> str:
     """Returns a suitable glossary name to be used in the test"""
     test_name = request.node.name
-    new_uuid = str(uuid.uuid1())
+    new_uuid = str(uuid.uuid4())
     return f"deepl-python-test-glossary: {test_name} {new_uuid}"
 
 
 @pytest.fixture
-def example_document_path(tmpdir):
-    tmpdir = pathlib.Path(tmpdir)
-    path = tmpdir / "input" / "example_document.txt"
+def example_document_path(tmp_path):
+    path = tmp_path / "input" / "example_document.txt"
     path.parent.mkdir()
     path.write_text(example_text["EN"])
     return path
 
 
-@pytest.fixture
-def example_glossary_csv(tmpdir):
-    tmpdir = pathlib.Path(tmpdir)
+# The example glossary CSV is never modified by tests, so it is written to
+# disk once per session.
+@pytest.fixture(scope="session")
+def example_glossary_csv(tmp_path_factory):
     content = (
         "sourceEntry1,targetEntry1,en,de\n"
         '"source""Entry","target,Entry",en,de'
     )
-    path = tmpdir / "glossary" / "example_glossary.csv"
-    path.parent.mkdir()
+    path = tmp_path_factory.mktemp("glossary") / "example_glossary.csv"
     path.write_text(content)
     return path
 
@@ -352,29 +449,36 @@ def example_document_translation():
 
 @pytest.fixture
 def example_large_document_translation():
-    return (example_text["DE"] + "\n") * 1000
+    return _example_large_document_text_de
+
+
+# Encoded once per session: comparing downloaded bytes against this avoids
+# decoding the whole large document per assertion.
+@pytest.fixture(scope="session")
+def example_large_document_translation_bytes():
+    return _example_large_document_text_de.encode("utf-8")
 
 
 @pytest.fixture
-def input_dir_path(tmpdir):
-    tmpdir = pathlib.Path(tmpdir)
-    path = tmpdir / "input"
+def input_dir_path(tmp_path):
+    path = tmp_path / "input"
     path.mkdir(exist_ok=True)
     return path
 
 
 @pytest.fixture
-def output_dir_path(tmpdir):
-    tmpdir = pathlib.Path(tmpdir)
-    path = tmpdir / "output"
+def output_dir_path(tmp_path):
+    path = tmp_path / "output"
     path.mkdir(exist_ok=True)
     return path
 
 
-@pytest.fixture
-def example_large_document_path(input_dir_path):
-    path = input_dir_path / "example_document.txt"
-    path.write_text((example_text["EN"] + "\n") * 1000)
+# The large document content is only read by tests, never modified, so it
+# is built once and written to disk once per session.
+@pytest.fixture(scope="session")
+def example_large_document_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("input") / "example_document.txt"
+    path.write_text(_example_large_document_text_en)
     return path
 
 
@@ -383,24 +487,55 @@ def output_document_path(output_dir_path):
     return output_dir_path / "example_document.txt"
 
 
+def _server_reachable() -> bool:
+    """Returns True if the configured server accepts TCP connections.
+
+    Probed once at import so that, if the server is down or there is no
+    network, server-dependent tests skip immediately instead of each
+    waiting out its own connection timeouts and retries."""
+    if _config.server_url:
+        parsed = urllib.parse.urlsplit(_config.server_url)
+        host = parsed.hostname
+        port = parsed.port or (80 if parsed.scheme == "http" else 443)
+    elif _config.auth_key and _config.mock_server_port is None:
+        host = (
+            "api-free.deepl.com"
+            if deepl.util.auth_key_is_free_account(_config.auth_key)
+            else "api.deepl.com"
+        )
+        port = 443
+    else:
+        # Without a configured server there is nothing to probe; do not
+        # skip, so tests report the usual configuration errors
+        return True
+    try:
+        socket.create_connection((host, port), timeout=2).close()
+        return True
+    except OSError:
+        return False
+
+
+_server_unreachable = not _server_reachable()
+
 # Decorate test functions with "@needs_mock_server" to skip them if a real
 #  server is used
 needs_mock_server = pytest.mark.skipif(
-    Config().mock_server_port is None,
-    reason="this test requires a mock server",
+    _config.mock_server_port is None or _server_unreachable,
+    reason="this test requires a reachable mock server",
 )
 # Decorate test functions with "@needs_mock_proxy_server" to skip them if a
 #  real server is used or mock proxy server is not configured
 needs_mock_proxy_server = pytest.mark.skipif(
-    Config().mock_proxy_server_port is None
-    or Config().mock_server_port is None,
-    reason="this test requires a mock proxy server",
+    _config.mock_proxy_server_port is None
+    or _config.mock_server_port is None
+    or _server_unreachable,
+    reason="this test requires a reachable mock proxy server",
 )
 # Decorate test functions with "@needs_real_server" to skip them if a mock
 #  server is used
 needs_real_server = pytest.mark.skipif(
-    not (Config().mock_server_port is None),
-    reason="this test requires a real server",
+    not (_config.mock_server_port is None) or _server_unreachable,
+    reason="this test requires a reachable real server",
 )
 
 
@@ -440,3 +575,6 @@ example_text = {
     "UK": "протонний пучок",
     "ZH": "质子束",
 }
+
+_example_large_document_text_en = (example_text["EN"] + "\n") * 1000
+_example_large_document_text_de = (example_text["DE"] + "\n") * 1000
@@ -5,79 +5,127 @@
 from click.testing import CliRunner
 from .conftest import example_text, needs_real_server
 
-# flake8: noqa: F401
-from deepl import __main__
+from deepl import __main__ as main_function
 import deepl
-import pathlib
+import io
+import json
 import pytest
 import re
 from unittest.mock import patch
 
 
-main_function = deepl.__main__
-
-
-@pytest.fixture
-def runner(server):
+# Example texts looked up and encoded once for the whole module
+example_text_en = example_text["EN"]
+example_text_de = example_text["DE"]
+example_text_en_bytes = example_text_en.encode("utf-8")
+
+# Patterns shared by several tests, compiled once at import
+version_regex = re.compile(r"deepl-python v\d+\.\d+\.\d+")
+ignore_tags_regex = re.compile(
+    "^Request details.*'ignore_tags': \\['a', 'b', 'c', 'd']", re.MULTILINE
+)
+splitting_tags_regex = re.compile(
+    "^Request details.*'splitting_tags': \\['split']", re.MULTILINE
+)
+
+# Glossary entries shared by the glossary tests, built once in each form
+# the CLI accepts
+glossary_entries = {"Hallo": "Hello", "Maler": "Artist"}
+glossary_entries_tsv = deepl.convert_dict_to_tsv(glossary_entries)
+glossary_entries_cli = "\n".join(
+    f"{s}={t}" for s, t in glossary_entries.items()
+)
+
+
+class _ResultMessage:
+    """Assertion message for CliRunner results, formatting the exit code
+    and captured output in one place instead of repeating the f-string in
+    every assertion."""
+
+    __slots__ = ("result",)
+
+    def __init__(self, result):
+        self.result = result
+
+    def __str__(self):
+        return f"exit: {self.result.exit_code}\n {self.result.output}"
+
+
+# The runner environment is derived from the session config and does not
+# vary between tests, and CliRunner keeps no state between invoke calls,
+# so one runner serves the whole session.
+@pytest.fixture(scope="session")
+def runner(config):
+    auth_key = (
+        "mock_server"
+        if config.mock_server_port is not None
+        else config.auth_key
+    )
     env = {
-        "DEEPL_SERVER_URL": server.server_url,
-        "DEEPL_AUTH_KEY": server.auth_key,
+        "DEEPL_SERVER_URL": config.server_url,
+        "DEEPL_AUTH_KEY": auth_key,
     }
     return CliRunner(env=env)
 
 
 def test_help(runner):
-    result = runner.invoke(main_function, "--help")
-    assert result.exit_code == 0, f"exit: {result.exit_code}\n {result.output}"
+    result = runner.invoke(main_function, ["--help"])
+    assert result.exit_code == 0, _ResultMessage(result)
     assert "usage" in result.output
 
 
 def test_version(runner):
-    result = runner.invoke(main_function, "--version")
-    assert result.exit_code == 0, f"exit: {result.exit_code}\n {result.output}"
+    result = runner.invoke(main_function, ["--version"])
+    assert result.exit_code == 0, _ResultMessage(result)
     assert "deepl-python v" in result.output
-    version_regex = re.compile(r"deepl-python v\d+\.\d+\.\d+")
-    assert version_regex.match(result.output) is not None
+    assert version_regex.fullmatch(result.output.strip()) is not None
 
 
 def test_verbose(runner):
     # verbose = info
-    result = runner.invoke(main_function, "--verbose usage")
-    assert result.exit_code == 0, f"exit: {result.exit_code}\n {result.output}"
+    result = runner.invoke(main_function, ["--verbose", "usage"])
+    assert result.exit_code == 0, _ResultMessage(result)
     assert "Request to DeepL API" in result.output
 
     # verbose = debug
-    result = runner.invoke(main_function, "-vv usage")
-    assert result.exit_code == 0, f"exit: {result.exit_code}\n {result.output}"
+    result = runner.invoke(main_function, ["-vv", "usage"])
+    assert result.exit_code == 0, _ResultMessage(result)
     assert "Request to DeepL API" in result.output
     assert "Request details" in result.output
 
 
 def test_no_auth(runner):
     result = runner.invoke(
-        main_function, "usage", env={"DEEPL_AUTH_KEY": None}
+        main_function, ["usage"], env={"DEEPL_AUTH_KEY": None}
     )
-    assert result.exit_code == 1, f"exit: {result.exit_code}\n {result.output}"
+    assert result.exit_code == 1, _ResultMessage(result)
     assert "DEEPL_AUTH_KEY" in result.output
 
 
 # Unfortunately there is no secure way to use the keyring module in our CI,
-# so we have to mock the module's behavior here
+# so we have to stub the module's behavior here
 # For the reason, see https://github.com/jaraco/keyring/issues/477
-@patch("deepl.__main__._optional_import")
-def test_keyring_auth(import_mock, runner):
-    mocked_keyring = {
+def test_keyring_auth(monkeypatch, runner):
+    stubbed_keyring = {
         "deepl": {"DEEPL_AUTH_KEY": runner.env["DEEPL_AUTH_KEY"]}
     }
 
-    def get_pw_mock(service_name, username):
-        return mocked_keyring[service_name][username]
+    class KeyringStub:
+        class errors:
+            class NoKeyringError(Exception):
+                pass
+
+        @staticmethod
+        def get_password(service_name, username):
+            return stubbed_keyring[service_name][username]
 
-    import_mock.return_value.get_password.side_effect = get_pw_mock
+    monkeypatch.setattr(
+        main_function, "_optional_import", lambda module_name: KeyringStub
+    )
     result = runner.invoke(
-        main_function, "usage", env={"DEEPL_AUTH_KEY": None}
+        main_function, ["usage"], env={"DEEPL_AUTH_KEY": None}
     )
-    assert result.exit_code == 0, f"exit: {result.exit_code}\n {result.output}"
+    assert result.exit_code == 0, _ResultMessage(result)
     assert "Usage this billing period" in result.output
 
 
@@ -86,9 +134,9 @@ def test_no_auth_no_keyring(mock, runner):
     mock.side_effect = ImportError("Keyring module not available in this test")
 
     result = runner.invoke(
-        main_function, "usage", env={"DEEPL_AUTH_KEY": None}
+        main_function, ["usage"], env={"DEEPL_AUTH_KEY": None}
     )
-    assert result.exit_code == 1, f"exit: {result.exit_code}\n {result.output}"
+    assert result.exit_code == 1, _ResultMessage(result)
     assert "DEEPL_AUTH_KEY" in result.output
 
 
@@ -96,33 +144,33 @@ def test_no_auth_no_keyring(mock, runner):
 def test_env_auth_no_keyring(mock, runner):
     mock.side_effect = ImportError("Keyring module not available in this test")
 
-    result = runner.invoke(main_function, "usage")
-    assert result.exit_code == 0, f"exit: {result.exit_code}\n {result.output}"
+    result = runner.invoke(main_function, ["usage"])
+    assert result.exit_code == 0, _ResultMessage(result)
     assert "Usage this billing period" in result.output
 
 
 def test_no_command(runner):
-    result = runner.invoke(main_function, "")
-    assert result.exit_code == 1, f"exit: {result.exit_code}\n {result.output}"
+    result = runner.invoke(main_function, [])
+    assert result.exit_code == 1, _ResultMessage(result)
     assert "command is required" in result.output
 
 
 def test_usage(runner):
-    result = runner.invoke(main_function, "usage")
-    assert result.exit_code == 0, f"exit: {result.exit_code}\n {result.output}"
+    result = runner.invoke(main_function, ["usage"])
+    assert result.exit_code == 0, _ResultMessage(result)
     assert "Usage this billing period" in result.output
 
 
 def test_languages(runner):
-    result = runner.invoke(main_function, "languages")
-    assert result.exit_code == 0, f"exit: {result.exit_code}\n {result.output}"
+    result = runner.invoke(main_function, ["languages"])
+    assert result.exit_code == 0, _ResultMessage(result)
     assert "Source languages" in result.output
     assert "Target languages" in result.output
     assert "DE: German" in result.output
     assert "EN: English" in result.output
 
-    result = runner.invoke(deepl.__main__, "languages --glossary")
-    assert result.exit_code == 0, f"exit: {result.exit_code}\n {result.output}"
+    result = runner.invoke(main_function, ["languages", "--glossary"])
+    assert result.exit_code == 0, _ResultMessage(result)
     assert "supported for glossaries" in result.output
     assert "de, en" in result.output
 
@@ -130,168 +178,211 @@ def test_languages(runner):
 def test_text(runner):
     result = runner.invoke(
         main_function,
-        'text --to DE "proton beam" --show-detected-source '
-        "--show-model-type-used --model-type quality_optimized",
+        ["text", "--to", "DE", "proton beam", "--show-detected-source"]
+        + ["--show-model-type-used", "--model-type", "quality_optimized"],
     )
-    assert result.exit_code == 0, f"exit: {result.exit_code}\n {result.output}"
-    assert example_text["DE"] in result.output
+    assert result.exit_code == 0, _ResultMessage(result)
+    assert example_text_de in result.output
     assert "Detected source" in result.output
     assert "Model type used: quality_optimized" in result.output
 
-    # Test text options
-    extra_options = [
-        ("--formality more", "'formality': 'more'"),
-        ("--formality prefer_less", "'formality': 'prefer_less'"),
-        ("--split-sentences 0", "'split_sentences': '0'"),
-        ("--preserve-formatting", "'preserve_formatting': True"),
-        ("--tag-handling xml", "'tag_handling': 'xml'"),
-        ("--outline-detection-off", "'outline_detection': False"),
-        (
-            "--ignore-tags a,b --ignore-tags c",
-            "'ignore_tags': ['a', 'b', 'c']",
-        ),
-        (
-            "--splitting-tags a,b --splitting-tags c",
-            "'splitting_tags': ['a', 'b', 'c']",
-        ),
-        (
-            "--non-splitting-tags a,b --non-splitting-tags c",
-            "'non_splitting_tags': ['a', 'b', 'c']",
-        ),
-        (
-            "--model-type quality_optimized",
-            "'model_type': 'quality_optimized'",
-        ),
-    ]
-    for args, search_str in extra_options:
-        result = runner.invoke(
-            main_function, f'-vv text --to DE "proton beam" {args}'
-        )
-        assert (
-            result.exit_code == 0
-        ), f"exit: {result.exit_code}\n {result.output}"
-        request_details = next(
-            line
-            for line in result.output.splitlines()
-            if line.startswith("Request details data")
-        )
-        assert search_str in request_details
+
+text_extra_options = [
+    (["--formality", "more"], "'formality': 'more'"),
+    (["--formality", "prefer_less"], "'formality': 'prefer_less'"),
+    (["--split-sentences", "0"], "'split_sentences': '0'"),
+    (["--preserve-formatting"], "'preserve_formatting': True"),
+    (["--tag-handling", "xml"], "'tag_handling': 'xml'"),
+    (["--outline-detection-off"], "'outline_detection': False"),
+    (
+        ["--ignore-tags", "a,b", "--ignore-tags", "c"],
+        "'ignore_tags': ['a', 'b', 'c']",
+    ),
+    (
+        ["--splitting-tags", "a,b", "--splitting-tags", "c"],
+        "'splitting_tags': ['a', 'b', 'c']",
+    ),
+    (
+        ["--non-splitting-tags", "a,b", "--non-splitting-tags", "c"],
+        "'non_splitting_tags': ['a', 'b', 'c']",
+    ),
+    (
+        ["--model-type", "quality_optimized"],
+        "'model_type': 'quality_optimized'",
+    ),
+]
+
+
+@pytest.fixture
+def mock_client(monkeypatch):
+    """Replaces HttpClient.request_with_backoff with a canned translation
+    response. Tests that only assert on the prepared request parameters do
+    not need a server round-trip."""
+    canned_response = json.dumps(
+        {
+            "translations": [
+                {
+                    "text": example_text_de,
+                    "detected_source_language": "EN",
+                    "billed_characters": len(example_text_en),
+                    "model_type_used": "quality_optimized",
+                }
+            ]
+        }
+    )
+
+    def canned_request(self, method, url, data=None, json=None, **kwargs):
+        return 200, canned_response
+
+    monkeypatch.setattr(
+        deepl.http_client.HttpClient, "request_with_backoff", canned_request
+    )
+
+
+@pytest.mark.parametrize("args,search_str", text_extra_options)
+def test_text_options(runner, mock_client, args, search_str):
+    result = runner.invoke(
+        main_function,
+        ["-vv", "text", "--to", "DE", "proton beam"] + args,
+        env={"DEEPL_AUTH_KEY": runner.env["DEEPL_AUTH_KEY"] or "mock-key"},
+    )
+    assert result.exit_code == 0, _ResultMessage(result)
+    request_details = next(
+        line
+        for line in io.StringIO(result.output)
+        if line.startswith("Request details data")
+    )
+    assert search_str in request_details
 
 
 def test_text_stdin(runner):
     result = runner.invoke(
         main_function,
-        "text --to DE --show-detected-source -",
-        input=example_text["EN"],
+        ["text", "--to", "DE", "--show-detected-source", "-"],
+        input=example_text_en,
     )
-    assert result.exit_code == 0, f"exit: {result.exit_code}\n {result.output}"
-    assert example_text["DE"] in result.output
+    assert result.exit_code == 0, _ResultMessage(result)
+    assert example_text_de in result.output
     assert "Detected source" in result.output
 
 
 @needs_real_server
 def test_text_preserve_formatting(runner):
     result = runner.invoke(
-        main_function, 'text --to DE --preserve-formatting "proton beam"'
+        main_function,
+        ["text", "--to", "DE", "--preserve-formatting", "proton beam"],
     )
-    assert result.exit_code == 0, f"exit: {result.exit_code}\n {result.output}"
-    assert example_text["DE"].lower() in result.output
+    assert result.exit_code == 0, _ResultMessage(result)
+    assert example_text_de.lower() in result.output
 
 
 def test_text_split_sentences(runner):
     result = runner.invoke(
         main_function,
-        '-vv text --to DE --split-sentences nonewlines "proton beam"',
+        ["-vv", "text", "--to", "DE"]
+        + ["--split-sentences", "nonewlines", "proton beam"],
     )
-    assert result.exit_code == 0, f"exit: {result.exit_code}\n {result.output}"
+    assert result.exit_code == 0, _ResultMessage(result)
     # Check split_sentences parameter is sent in HTTP request
-    regex = re.compile("Request details.*split_sentences.*nonewlines.*")
-    assert any(
-        regex.match(line) is not None for line in result.output.split("\n")
-    ), f"output:\n{result.output}"
+    request_details = next(
+        line
+        for line in io.StringIO(result.output)
+        if line.startswith("Request details")
+    )
+    assert "split_sentences" in request_details, f"output:\n{result.output}"
+    assert "nonewlines" in request_details, f"output:\n{result.output}"
 
 
 def test_text_tags(runner):
     result = runner.invoke(
         main_function,
-        "-vv text --to DE --tag-handling xml --splitting-tags split "
-        '--ignore-tags a,b --ignore-tags c --ignore-tags d "proton beam"',
+        ["-vv", "text", "--to", "DE", "--tag-handling", "xml"]
+        + ["--splitting-tags", "split", "--ignore-tags", "a,b"]
+        + ["--ignore-tags", "c", "--ignore-tags", "d", "proton beam"],
     )
-    assert result.exit_code == 0, f"exit: {result.exit_code}\n {result.output}"
+    assert result.exit_code == 0, _ResultMessage(result)
     # Check ignore_tags parameter is sent in HTTP request
-    regex = re.compile(
-        "Request details.*'ignore_tags': \\['a', 'b', 'c', 'd']"
-    )
-    assert any(
-        regex.match(line) is not None for line in result.output.split("\n")
+    assert (
+        ignore_tags_regex.search(result.output) is not None
     ), f"output:\n{result.output}"
     # Check splitting_tags parameter is sent in HTTP request
-    regex = re.compile("Request details.*'splitting_tags': \\['split']")
-    assert any(
-        regex.match(line) is not None for line in result.output.split("\n")
+    assert (
+        splitting_tags_regex.search(result.output) is not None
     ), f"output:\n{result.output}"
 
 
 def test_text_html_tag_handling(runner):
     result = runner.invoke(
         main_function,
-        '-vv text --to DE --tag-handling html "<html><p>Test</p></html>"',
+        ["-vv", "text", "--to", "DE", "--tag-handling", "html"]
+        + ["<html><p>Test</p></html>"],
     )
-    assert result.exit_code == 0, f"exit: {result.exit_code}\n {result.output}"
+    assert result.exit_code == 0, _ResultMessage(result)
+
+
+@pytest.fixture
+def document_paths(tmp_path):
+    """Fixture function that writes the example input document and returns
+    its path together with the output directory path. The input file name
+    may be overridden, for example to use an invalid file extension."""
 
+    def make(input_name="document.txt"):
+        input_document = tmp_path / input_name
+        input_document.write_bytes(example_text_en_bytes)
+        return input_document, tmp_path / "output"
 
-def test_document(runner, tmpdir):
-    tmpdir = pathlib.Path(tmpdir)
-    output_dir = tmpdir / "output"
-    input_document = tmpdir / "document.txt"
-    input_document.write_text(example_text["EN"])
+    return make
+
+
+def test_document(runner, document_paths):
+    input_document, output_dir = document_paths()
     output_document = output_dir / "document.txt"
 
     result = runner.invoke(
-        main_function, f"-vv document --to DE {input_document} {output_dir}"
+        main_function,
+        ["-vv", "document", "--to", "DE"]
+        + [str(input_document), str(output_dir)],
     )
-    assert result.exit_code == 0, f"exit: {result.exit_code}\n {result.output}"
-    assert example_text["DE"] == output_document.read_text()
+    assert result.exit_code == 0, _ResultMessage(result)
+    assert example_text_de == output_document.read_text()
 
 
-def test_document_occupied_output(runner, tmpdir):
-    tmpdir = pathlib.Path(tmpdir)
-    output_dir = tmpdir / "output"
-    input_document = tmpdir / "document.txt"
-    input_document.write_text(example_text["EN"])
+def test_document_occupied_output(runner, document_paths):
+    input_document, output_dir = document_paths()
     # Create a file in place of the output directory
     output_dir.touch()
 
     result = runner.invoke(
-        main_function, f"-vv document --to DE {input_document} {output_dir}"
+        main_function,
+        ["-vv", "document", "--to", "DE"]
+        + [str(input_document), str(output_dir)],
     )
-    assert result.exit_code == 1, f"exit: {result.exit_code}\n {result.output}"
+    assert result.exit_code == 1, _ResultMessage(result)
     assert "already exists" in result.output
 
 
-def test_invalid_document(runner, tmpdir):
-    tmpdir = pathlib.Path(tmpdir)
-    output_dir = tmpdir / "output"
-    input_document = tmpdir / "document.invalid"
-    input_document.write_text(example_text["EN"])
+def test_invalid_document(runner, document_paths):
+    input_document, output_dir = document_paths("document.invalid")
 
     result = runner.invoke(
-        main_function, f"-vv document --to DE {input_document} {output_dir}"
+        main_function,
+        ["-vv", "document", "--to", "DE"]
+        + [str(input_document), str(output_dir)],
     )
-    assert result.exit_code == 1, f"exit: {result.exit_code}\n {result.output}"
+    assert result.exit_code == 1, _ResultMessage(result)
     assert "Invalid file" in result.output or "file extension" in result.output
 
 
 def test_glossary_no_subcommand(runner):
-    result = runner.invoke(main_function, "glossary")
-    assert result.exit_code == 1, f"exit: {result.exit_code}\n {result.output}"
+    result = runner.invoke(main_function, ["glossary"])
+    assert result.exit_code == 1, _ResultMessage(result)
     assert "subcommand is required" in result.output
 
 
 def test_glossary_create(
     runner,
     glossary_name,
-    tmpdir,
+    tmp_path,
     cleanup_matching_glossaries,
     example_glossary_csv,
 ):
@@ -299,82 +390,67 @@ def test_glossary_create(
     name_stdin = f"{glossary_name}-stdin"
     name_file = f"{glossary_name}-file"
     name_csv = f"{glossary_name}-csv"
-    entries = {"Hallo": "Hello", "Maler": "Artist"}
-    entries_tsv = deepl.convert_dict_to_tsv(entries)
-    entries_cli = "\n".join(f"{s}={t}" for s, t in entries.items())
-    file = tmpdir / "glossary_entries"
-    file.write(entries_tsv)
+    names = {name_cli, name_stdin, name_file, name_csv}
+    file = tmp_path / "glossary_entries"
+    file.write_text(glossary_entries_tsv)
 
     try:
         result = runner.invoke(
             main_function,
-            f'-vv glossary create --name "{name_cli}" --from DE --to EN '
-            f"{entries_cli}",
+            ["-vv", "glossary", "create", "--name", name_cli]
+            + ["--from", "DE", "--to", "EN"]
+            + glossary_entries_cli.split("\n"),
         )
-        assert (
-            result.exit_code == 0
-        ), f"exit: {result.exit_code}\n {result.output}"
+        assert result.exit_code == 0, _ResultMessage(result)
         result = runner.invoke(
             main_function,
-            f'-vv glossary create --name "{name_stdin}" --from DE --to EN -',
-            input=entries_tsv,
+            ["-vv", "glossary", "create", "--name", name_stdin]
+            + ["--from", "DE", "--to", "EN", "-"],
+            input=glossary_entries_tsv,
         )
-        assert (
-            result.exit_code == 0
-        ), f"exit: {result.exit_code}\n {result.output}"
+        assert result.exit_code == 0, _ResultMessage(result)
         result = runner.invoke(
             main_function,
-            f'-vv glossary create --name "{name_file}" --from DE --to EN '
-            f"--file {file}",
+            ["-vv", "glossary", "create", "--name", name_file]
+            + ["--from", "DE", "--to", "EN", "--file", str(file)],
         )
-        assert (
-            result.exit_code == 0
-        ), f"exit: {result.exit_code}\n {result.output}"
+        assert result.exit_code == 0, _ResultMessage(result)
         result = runner.invoke(
             main_function,
-            f'-vv glossary create --name "{name_csv}" --from EN --to DE '
-            f"--file {example_glossary_csv} --csv",
+            ["-vv", "glossary", "create", "--name", name_csv]
+            + ["--from", "EN", "--to", "DE"]
+            + ["--file", str(example_glossary_csv), "--csv"],
         )
-        assert (
-            result.exit_code == 0
-        ), f"exit: {result.exit_code}\n {result.output}"
-
-        result = runner.invoke(main_function, "-vv glossary list")
-        assert (
-            result.exit_code == 0
-        ), f"exit: {result.exit_code}\n {result.output}"
-        assert name_cli in result.output
-        assert name_stdin in result.output
-        assert name_file in result.output
-        assert name_csv in result.output
+        assert result.exit_code == 0, _ResultMessage(result)
+
+        result = runner.invoke(main_function, ["-vv", "glossary", "list"])
+        assert result.exit_code == 0, _ResultMessage(result)
+        for name in names:
+            assert name in result.output
 
         # Cannot use --file option together with entries
         result = runner.invoke(
             main_function,
-            f'-vv glossary create --name "{name_file}" --from DE --to EN '
-            f"--file {file} {entries_cli}",
+            ["-vv", "glossary", "create", "--name", name_file]
+            + ["--from", "DE", "--to", "EN", "--file", str(file)]
+            + glossary_entries_cli.split("\n"),
         )
-        assert (
-            result.exit_code == 1
-        ), f"exit: {result.exit_code}\n {result.output}"
+        assert result.exit_code == 1, _ResultMessage(result)
         assert "--file argument" in result.output
 
     finally:
-        cleanup_matching_glossaries(
-            lambda glossary: glossary.name
-            in [name_file, name_cli, name_stdin, name_csv]
-        )
+        cleanup_matching_glossaries(lambda glossary: glossary.name in names)
 
 
 def test_glossary_get(translator, runner, glossary_manager):
     with glossary_manager() as created_glossary:
         created_id = created_glossary.glossary_id
 
-        result = runner.invoke(main_function, f"-vv glossary get {created_id}")
+        result = runner.invoke(
+            main_function, ["-vv", "glossary", "get", created_id]
+        )
         print(result.output)
-        assert (
-            result.exit_code == 0
-        ), f"exit: {result.exit_code}\n {result.output}"
+        assert result.exit_code == 0, _ResultMessage(result)
         assert created_id in result.output
         assert created_glossary.name in result.output
 
@@ -385,47 +461,36 @@ def test_glossary_list(translator, runner, glossary_manager):
     ) as g2, glossary_manager(glossary_name_suffix="3") as g3:
         glossary_list = [g1, g2, g3]
 
-        result = runner.invoke(main_function, "-vv glossary list")
-        assert (
-            result.exit_code == 0
-        ), f"exit: {result.exit_code}\n {result.output}"
+        result = runner.invoke(main_function, ["-vv", "glossary", "list"])
+        assert result.exit_code == 0, _ResultMessage(result)
         for glossary in glossary_list:
             assert glossary.name in result.output
 
 
 def test_glossary_entries(translator, runner, glossary_manager):
-    entries = {"Hallo": "Hello", "Maler": "Artist"}
-    with glossary_manager(entries=entries) as created_glossary:
+    with glossary_manager(entries=glossary_entries) as created_glossary:
         created_id = created_glossary.glossary_id
         result = runner.invoke(
-            main_function, f"-vv glossary entries {created_id}"
+            main_function, ["-vv", "glossary", "entries", created_id]
         )
-        assert (
-            result.exit_code == 0
-        ), f"exit: {result.exit_code}\n {result.output}"
-        for source, target in entries.items():
+        assert result.exit_code == 0, _ResultMessage(result)
+        for source, target in glossary_entries.items():
             assert f"{source}\t{target}" in result.output
 
 
 def test_glossary_delete(translator, runner, glossary_manager):
     with glossary_manager() as created_glossary:
         created_id = created_glossary.glossary_id
-        result = runner.invoke(main_function, "glossary list")
-        assert (
-            result.exit_code == 0
-        ), f"exit: {result.exit_code}\n {result.output}"
+        result = runner.invoke(main_function, ["glossary", "list"])
+        assert result.exit_code == 0, _ResultMessage(result)
         assert created_id in result.output
 
         # Remove the created glossary
         result = runner.invoke(
-            main_function, f'glossary delete "{created_id}"'
+            main_function, ["glossary", "delete", created_id]
         )
-        assert (
-            result.exit_code == 0
-        ), f"exit: {result.exit_code}\n {result.output}"
-
-        result = runner.invoke(main_function, "glossary list")
-        assert (
-            result.exit_code == 0
-        ), f"exit: {result.exit_code}\n {result.output}"
+        assert result.exit_code == 0, _ResultMessage(result)
+
+        result = runner.invoke(main_function, ["glossary", "list"])
+        assert result.exit_code == 0, _ResultMessage(result)
         assert created_id not in result.output
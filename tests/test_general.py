@@ -9,34 +9,50 @@ from .conftest import (
     needs_real_server,
 )
 from requests import Response  # type: ignore
+import requests  # type: ignore
 from unittest.mock import patch, Mock
 import deepl
-import pathlib
 import pytest
 import os
 
 
+# Authentication key for tests that patch the HTTP transport and never
+# reach the network: looked up once at import, with a placeholder so the
+# tests also run in mock-server-only environments without the variable.
+_AUTH_KEY = os.getenv("DEEPL_AUTH_KEY") or "test-auth-key"
+
+
 def test_version():
     assert "1.21.0" == deepl.__version__
 
 
+# The example texts grouped by base source language, so that regional
+# variants (EN-GB/EN-US, PT-BR/PT-PT, ...) share one batched API call.
+_example_translation_groups: dict = {}
+for _lang in example_text:
+    _example_translation_groups.setdefault(
+        deepl.Language.remove_regional_variant(_lang), []
+    ).append(_lang)
+
+
 @pytest.mark.parametrize(
-    "lang",
-    [k for k in example_text.keys()],
+    "source_lang,langs",
+    list(_example_translation_groups.items()),
+    ids=list(_example_translation_groups),
 )
-def test_example_translation(lang, translator):
+def test_example_translation(source_lang, langs, shared_translator):
     """Tests translations of pre-prepared example texts to ensure translation
     is working.
 
     The texts are translations of "proton beam"."""
 
-    input_text = example_text[lang]
-    source_lang = deepl.Language.remove_regional_variant(lang)
-    result = translator.translate_text(
-        input_text, source_lang=source_lang, target_lang="EN-US"
+    input_texts = [example_text[lang] for lang in langs]
+    results = shared_translator.translate_text(
+        input_texts, source_lang=source_lang, target_lang="EN-US"
     )
-    assert "proton" in result.text.lower()
-    assert result.billed_characters == len(input_text)
+    for input_text, result in zip(input_texts, results):
+        assert "proton" in result.text.lower()
+        assert result.billed_characters == len(input_text)
 
 
 @needs_real_server
@@ -88,28 +104,25 @@ def test_invalid_server_url(server):
         translator.get_usage()
 
 
-def test_usage(translator):
-    usage = translator.get_usage()
+def test_usage(shared_translator):
+    usage = shared_translator.get_usage()
     assert "Usage this billing period" in str(usage)
 
 
-def test_language(translator):
-    source_languages = translator.get_source_languages()
+def test_language(source_languages, target_languages):
     for source_language in source_languages:
         if source_language.code == "EN":
             assert source_language.name == "English"
         assert str(source_language) == source_language.code
         assert source_language.supports_formality is None
 
-    target_languages = translator.get_target_languages()
     for target_language in target_languages:
         if target_language.code == "DE":
             assert target_language.supports_formality
         assert target_language.supports_formality is not None
 
 
-def test_glossary_languages(translator):
-    glossary_languages = translator.get_glossary_languages()
+def test_glossary_languages(glossary_languages):
     assert len(glossary_languages) > 0
     for language_pair in glossary_languages:
         assert len(language_pair.source_lang) > 0
@@ -123,91 +136,64 @@ def test_server_url_selected_based_on_auth_key(server):
     assert translator_free.server_url == "https://api-free.deepl.com"
 
 
-@patch("requests.adapters.HTTPAdapter.send")
-def test_user_agent(mock_send):
-    mock_send.return_value = _build_test_response()
-    translator = deepl.Translator(os.environ["DEEPL_AUTH_KEY"])
-    translator.translate_text(example_text["EN"], target_lang="DA")
-    ua_header = mock_send.call_args[0][0].headers["User-agent"]
-    assert "requests/" in ua_header
-    assert " python/" in ua_header
-    assert "(" in ua_header
+_APP_INFO_SUFFIX = " sample_python_plugin/1.0.2"
 
 
+@pytest.mark.parametrize(
+    "send_platform_info,custom_user_agent,with_app_info",
+    [
+        (True, None, False),
+        (False, None, False),
+        (True, "my custom user agent", False),
+        (True, None, True),
+        (False, None, True),
+        (True, "my custom user agent", True),
+    ],
+    ids=[
+        "default",
+        "opt-out",
+        "custom",
+        "app-info",
+        "opt-out-app-info",
+        "custom-app-info",
+    ],
+)
 @patch("requests.adapters.HTTPAdapter.send")
-def test_user_agent_opt_out(mock_send):
-    mock_send.return_value = _build_test_response()
+def test_user_agent(
+    mock_send,
+    monkeypatch,
+    send_platform_info,
+    custom_user_agent,
+    with_app_info,
+):
+    mock_send.return_value = _TEST_RESPONSE
+    if custom_user_agent is not None:
+        monkeypatch.setattr(deepl.http_client, "user_agent", custom_user_agent)
     translator = deepl.Translator(
-        os.environ["DEEPL_AUTH_KEY"], send_platform_info=False
+        _AUTH_KEY, send_platform_info=send_platform_info
     )
+    if with_app_info:
+        translator.set_app_info("sample_python_plugin", "1.0.2")
     translator.translate_text(example_text["EN"], target_lang="DA")
     ua_header = mock_send.call_args[0][0].headers["User-agent"]
-    assert "requests/" not in ua_header
-    assert " python/" not in ua_header
-    assert "(" not in ua_header
-
-
-@patch("requests.adapters.HTTPAdapter.send")
-def test_custom_user_agent(mock_send):
-    mock_send.return_value = _build_test_response()
-    old_user_agent = deepl.http_client.user_agent
-    deepl.http_client.user_agent = "my custom user agent"
-    translator = deepl.Translator(os.environ["DEEPL_AUTH_KEY"])
-    translator.translate_text(example_text["EN"], target_lang="DA")
-    ua_header = mock_send.call_args[0][0].headers["User-agent"]
-    assert ua_header == "my custom user agent"
-    deepl.http_client.user_agent = old_user_agent
-
-
-@patch("requests.adapters.HTTPAdapter.send")
-def test_user_agent_with_app_info(mock_send):
-    mock_send.return_value = _build_test_response()
-    translator = deepl.Translator(
-        os.environ["DEEPL_AUTH_KEY"],
-    ).set_app_info("sample_python_plugin", "1.0.2")
-    translator.translate_text(example_text["EN"], target_lang="DA")
-    ua_header = mock_send.call_args[0][0].headers["User-agent"]
-    assert "requests/" in ua_header
-    assert " python/" in ua_header
-    assert "(" in ua_header
-    assert " sample_python_plugin/1.0.2" in ua_header
-
-
-@patch("requests.adapters.HTTPAdapter.send")
-def test_user_agent_opt_out_with_app_info(mock_send):
-    mock_send.return_value = _build_test_response()
-    translator = deepl.Translator(
-        os.environ["DEEPL_AUTH_KEY"],
-        send_platform_info=False,
-    ).set_app_info("sample_python_plugin", "1.0.2")
-    translator.translate_text(example_text["EN"], target_lang="DA")
-    ua_header = mock_send.call_args[0][0].headers["User-agent"]
-    assert "requests/" not in ua_header
-    assert " python/" not in ua_header
-    assert "(" not in ua_header
-    assert " sample_python_plugin/1.0.2" in ua_header
 
-
-@patch("requests.adapters.HTTPAdapter.send")
-def test_custom_user_agent_with_app_info(mock_send):
-    mock_send.return_value = _build_test_response()
-    old_user_agent = deepl.http_client.user_agent
-    deepl.http_client.user_agent = "my custom user agent"
-    translator = deepl.Translator(os.environ["DEEPL_AUTH_KEY"]).set_app_info(
-        "sample_python_plugin", "1.0.2"
-    )
-    translator.translate_text(example_text["EN"], target_lang="DA")
-    ua_header = mock_send.call_args[0][0].headers["User-agent"]
-    assert ua_header == "my custom user agent sample_python_plugin/1.0.2"
-    deepl.http_client.user_agent = old_user_agent
+    if custom_user_agent is not None:
+        expected = custom_user_agent
+        if with_app_info:
+            expected += _APP_INFO_SUFFIX
+        assert ua_header == expected
+    else:
+        for platform_detail in ("requests/", " python/", "("):
+            assert (platform_detail in ua_header) == send_platform_info
+        assert (_APP_INFO_SUFFIX in ua_header) == with_app_info
 
 
 @patch("requests.adapters.HTTPAdapter.send")
 @patch("platform.platform")
 def test_user_agent_exception(platform_mock, mock_send):
-    mock_send.return_value = _build_test_response()
+    mock_send.return_value = _TEST_RESPONSE
     platform_mock.side_effect = OSError("mocked test exception")
-    translator = deepl.Translator(os.environ["DEEPL_AUTH_KEY"])
+    translator = deepl.Translator(_AUTH_KEY)
     translator.translate_text(example_text["EN"], target_lang="DA")
     ua_header = mock_send.call_args[0][0].headers["User-agent"]
     assert "deepl-python" in ua_header
@@ -230,31 +216,47 @@ def test_proxy_usage(
         translator_with_random_auth_key.get_usage()
 
 
-@needs_mock_server
-def test_usage_no_response(translator, server, monkeypatch):
-    server.no_response(2)
-
-    # Lower the retry count and timeout for this test, and restore after test
+@patch("requests.adapters.HTTPAdapter.send")
+def test_usage_no_response(mock_send, monkeypatch):
+    # Lower the retry count for this test, and restore after test. The
+    # patched send fails instantly, so no real timeout is consumed.
     monkeypatch.setattr(deepl.http_client, "max_network_retries", 0)
-    monkeypatch.setattr(deepl.http_client, "min_connection_timeout", 1.0)
+    mock_send.side_effect = requests.exceptions.ConnectTimeout("test")
 
+    translator = deepl.Translator(_AUTH_KEY)
     with pytest.raises(deepl.exceptions.ConnectionException):
         translator.get_usage()
 
 
-@needs_mock_server
-def test_translate_too_many_requests(translator, server, monkeypatch):
-    server.respond_with_429(2)
-    # Lower the retry count and timeout for this test, and restore after test
+@patch("requests.adapters.HTTPAdapter.send")
+def test_translate_too_many_requests(mock_send, monkeypatch):
+    # Lower the retry count for this test, and restore after test. The
+    # patched send delivers both 429 responses instantly; skipping the
+    # backoff sleep keeps the retry loop instant as well.
     monkeypatch.setattr(deepl.http_client, "max_network_retries", 1)
-    monkeypatch.setattr(deepl.http_client, "min_connection_timeout", 1.0)
+    monkeypatch.setattr(deepl.http_client.time, "sleep", lambda duration: None)
+    mock_send.return_value = _TEST_RESPONSE_429
 
+    translator = deepl.Translator(_AUTH_KEY)
     with pytest.raises(deepl.exceptions.TooManyRequestsException):
-        translator.translate_text(example_text["EN"], target_lang="DE")
+        translator.translate_text(example_text["EN"], target_lang="DA")
+
+
+def _translate_test_document(translator, tmp_path, character_count):
+    """Writes a document of the given size and translates it to German,
+    returning the input and output paths. Shared setup for the usage-limit
+    tests."""
+    input_path = tmp_path / "example_document.txt"
+    input_path.write_bytes(b"a" * character_count)
+    output_path = tmp_path / "example_document_output.txt"
+    translator.translate_document_from_filepath(
+        input_path, output_path, target_lang="DE"
+    )
+    return input_path, output_path
 
 
 @needs_mock_server
-def test_usage_overrun(translator_with_random_auth_key, server, tmpdir):
+def test_usage_overrun(translator_with_random_auth_key, server, tmp_path):
     character_limit = 20
     document_limit = 1
     server.init_character_limit(character_limit)
@@ -267,12 +269,8 @@ def test_usage_overrun(translator_with_random_auth_key, server, tmpdir):
     assert "Characters: 0 of 20" in str(usage)
     assert "Documents: 0 of 1" in str(usage)
 
-    tmpdir = pathlib.Path(tmpdir)
-    input_path = tmpdir / "example_document.txt"
-    input_path.write_text("a" * character_limit)
-    output_path = tmpdir / "example_document_output.txt"
-    translator.translate_document_from_filepath(
-        input_path, output_path, target_lang="DE"
+    input_path, output_path = _translate_test_document(
+        translator, tmp_path, character_limit
     )
 
     usage = translator.get_usage()
@@ -297,7 +295,7 @@ def test_usage_overrun(translator_with_random_auth_key, server, tmpdir):
 
 @needs_mock_server
 def test_usage_team_document_limit(
-    translator_with_random_auth_key, server, tmpdir
+    translator_with_random_auth_key, server, tmp_path
 ):
     team_document_limit = 1
     server.init_character_limit(0)
@@ -311,13 +309,7 @@ def test_usage_team_document_limit(
     assert "Documents" not in str(usage)
     assert "Team documents: 0 of 1" in str(usage)
 
-    tmpdir = pathlib.Path(tmpdir)
-    input_path = tmpdir / "example_document.txt"
-    input_path.write_text("a")
-    output_path = tmpdir / "example_document_output.txt"
-    translator.translate_document_from_filepath(
-        input_path, output_path, target_lang="DE"
-    )
+    _translate_test_document(translator, tmp_path, 1)
 
     usage = translator.get_usage()
     assert usage.any_limit_reached
@@ -326,16 +318,18 @@ def test_usage_team_document_limit(
     assert usage.team_document.limit_reached
 
 
-def _build_test_response():
+def _build_test_response(status_code=200, text=None):
     response = Mock(spec=Response)
-    response.status_code = 200
-    response.text = (
-        '{"translations": [{'
-        '"detected_source_language": "EN", '
-        '"text": "protonstråle", '
-        f'"billed_characters": {len(example_text["EN"])}'
-        "}]}"
-    )
+    response.status_code = status_code
+    if text is None:
+        text = (
+            '{"translations": [{'
+            '"detected_source_language": "EN", '
+            '"text": "protonstråle", '
+            f'"billed_characters": {len(example_text["EN"])}'
+            "}]}"
+        )
+    response.text = text
     response.headers = {
         "Content-Type": "application/json",
         "Server": "nginx",
@@ -350,3 +344,9 @@ def _build_test_response():
     response.stream = False
     response.url = "https://api.deepl.com/v2/translate"
     return response
+
+
+# The user-agent tests only inspect the outgoing request; the canned
+# response is never mutated, so one instance serves them all.
+_TEST_RESPONSE = _build_test_response()
+_TEST_RESPONSE_429 = _build_test_response(429, "Too many requests")
@@ -5,19 +5,21 @@
 from .conftest import example_text, needs_real_server
 from deepl.api_data import WriteResult, WritingStyle
 
+# Constants looked up once for the whole module
+example_text_en = example_text["EN"]
+business_style = WritingStyle.BUSINESS.value
+
 
 def test_single_text(deepl_client):
-    result = deepl_client.rephrase_text(
-        example_text["EN"], target_lang="EN-GB"
-    )
-    _check_sanity_of_improvements(example_text["EN"], result)
+    result = deepl_client.rephrase_text(example_text_en, target_lang="EN-GB")
+    _check_sanity_of_improvements(example_text_en, result)
 
 
 @needs_real_server
 def test_business_style(deepl_client):
     input_text = "As Gregor Samsa awoke one morning from uneasy dreams he found himself transformed in his bed into a gigantic insect."  # noqa
     result = deepl_client.rephrase_text(
-        input_text, target_lang="EN-US", style=WritingStyle.BUSINESS.value
+        input_text, target_lang="EN-US", style=business_style
     )
     _check_sanity_of_improvements(input_text, result)
 
@@ -6,12 +6,34 @@ import re
 from .conftest import example_text, needs_mock_server, needs_real_server
 import deepl
 import io
-import pathlib
 import pytest
 import time
 
 default_lang_args = {"target_lang": "DE", "source_lang": "EN"}
 
+# Document handles are rendered as hex ID/key pairs in error messages;
+# compiled once for the module
+document_handle_regex = re.compile("ID: [0-9A-F]{32}, key: [0-9A-F]{64}")
+
+
+def _wait_until_done(translator, handle, base=0.1, cap=2.0, on_status=None):
+    """Polls the document status with exponential backoff until translation
+    finishes, returning the final status. The server-reported remaining time
+    caps the delay, so near-done documents are re-polled promptly while long
+    waits do not hammer the status endpoint."""
+    delay = base
+    status = translator.translate_document_get_status(handle)
+    while status.ok and not status.done:
+        if on_status is not None:
+            on_status(status)
+        interval = delay
+        if status.seconds_remaining is not None:
+            interval = min(interval, max(status.seconds_remaining, base))
+        time.sleep(min(interval, cap))
+        delay *= 2
+        status = translator.translate_document_get_status(handle)
+    return status
+
 
 def test_translate_document_from_filepath(
     translator,
@@ -75,7 +97,9 @@ def test_translate_document_with_waiting(
 
 @needs_mock_server
 def test_translate_large_document(
-    translator, example_large_document_path, example_large_document_translation
+    translator,
+    example_large_document_path,
+    example_large_document_translation_bytes,
 ):
     with io.BytesIO() as output_file:
         with open(example_large_document_path, "rb") as input_file:
@@ -84,45 +108,35 @@ def test_translate_large_document(
             )
 
         assert (
-            example_large_document_translation
-            == output_file.getvalue().decode()
+            example_large_document_translation_bytes == output_file.getvalue()
         )
 
 
 @needs_real_server
+@pytest.mark.parametrize(
+    "formality,expected",
+    [
+        (deepl.Formality.MORE, "Wie geht es Ihnen?"),
+        (deepl.Formality.LESS, "Wie geht es dir?"),
+        (deepl.Formality.PREFER_MORE, "Wie geht es Ihnen?"),
+        (deepl.Formality.PREFER_LESS, "Wie geht es dir?"),
+    ],
+)
 def test_translate_document_formality(
-    translator, example_document_path, output_document_path
+    translator,
+    example_document_path,
+    output_document_path,
+    formality,
+    expected,
 ):
-    example_document_path.write_text("How are you?")
+    example_document_path.write_bytes(b"How are you?")
     translator.translate_document_from_filepath(
         example_document_path,
         output_document_path,
-        formality=deepl.Formality.MORE,
+        formality=formality,
         **default_lang_args,
     )
-    assert "Wie geht es Ihnen?" == output_document_path.read_text()
-    translator.translate_document_from_filepath(
-        example_document_path,
-        output_document_path,
-        formality=deepl.Formality.LESS,
-        **default_lang_args,
-    )
-    assert "Wie geht es dir?" == output_document_path.read_text()
-    example_document_path.write_text("How are you?")
-    translator.translate_document_from_filepath(
-        example_document_path,
-        output_document_path,
-        formality=deepl.Formality.PREFER_MORE,
-        **default_lang_args,
-    )
-    assert "Wie geht es Ihnen?" == output_document_path.read_text()
-    translator.translate_document_from_filepath(
-        example_document_path,
-        output_document_path,
-        formality=deepl.Formality.PREFER_LESS,
-        **default_lang_args,
-    )
-    assert "Wie geht es dir?" == output_document_path.read_text()
+    assert expected == output_document_path.read_text()
 
 
 @needs_mock_server
@@ -132,7 +146,7 @@ def test_document_output_format(
     output_dir_path,
 ):
     # Mock server supports only TXT and HTML files, so translate TXT->HTML
-    example_document_path.write_text(example_text["EN"])
+    example_document_path.write_bytes(example_text["EN"].encode("utf-8"))
     output_document_path = output_dir_path / "example.html"
     translator.translate_document_from_filepath(
         example_document_path,
@@ -148,7 +162,7 @@ def test_document_failure_during_translation(
     translator, example_document_path, output_document_path
 ):
     # Translating text from DE to DE will trigger error
-    example_document_path.write_text(example_text["DE"])
+    example_document_path.write_bytes(example_text["DE"].encode("utf-8"))
     with pytest.raises(
         deepl.exceptions.DocumentTranslationException,
     ) as exc_info:
@@ -160,18 +174,16 @@ def test_document_failure_during_translation(
     exception = exc_info.value
     assert "Source and target language" in str(exception)
     assert exception.document_handle is not None
-    match = re.compile("ID: [0-9A-F]{32}, key: [0-9A-F]{64}")
-    assert match.search(str(exception)) is not None
+    assert document_handle_regex.search(str(exception)) is not None
     # document_request is a deprecated alias for document_handle
     assert exception.document_request is not None
 
 
-def test_invalid_document(translator, tmpdir):
-    tmpdir = pathlib.Path(tmpdir)
-    output_dir = tmpdir / "output"
+def test_invalid_document(translator, tmp_path):
+    output_dir = tmp_path / "output"
     output_dir.mkdir()
-    input_document = tmpdir / "document.invalid"
-    input_document.write_text(example_text["EN"])
+    input_document = tmp_path / "document.invalid"
+    input_document.write_bytes(example_text["EN"].encode("utf-8"))
     output_document = output_dir / "document.invalid"
 
     with pytest.raises(
@@ -205,12 +217,7 @@ def test_translate_document_low_level(
     del handle
 
     handle = deepl.DocumentHandle(doc_id, doc_key)
-    status = translator.translate_document_get_status(handle)
-    assert status.ok
-
-    while status.ok and not status.done:
-        status = translator.translate_document_get_status(handle)
-        time.sleep(0.2)
+    status = _wait_until_done(translator, handle)
 
     assert status.ok and status.done
     with open(output_document_path, "wb") as outfile:
@@ -228,17 +235,15 @@ def test_translate_document_string(translator, server):
         filename="test.txt",
     )
 
-    status = translator.translate_document_get_status(handle)
-    while status.ok and not status.done:
-        status = translator.translate_document_get_status(handle)
-        time.sleep(status.seconds_remaining or 1)
-
+    status = _wait_until_done(translator, handle)
     assert status.ok
     response = translator.translate_document_download(handle)
     try:
-        output = bytes()
-        for chunk in response.iter_content(chunk_size=128):
-            output += chunk
+        # bytearray grows in amortized-linear time, unlike repeated
+        # bytes concatenation
+        output = bytearray()
+        for chunk in response.iter_content(chunk_size=8192):
+            output.extend(chunk)
         output_string = output.decode()
         assert output_string == example_text["DE"]
     finally:
@@ -258,21 +263,24 @@ def test_translate_document_request_fields(
             infile, **default_lang_args
         )
 
-    status = translator.translate_document_get_status(handle)
-    assert status.ok
-    while status.ok and not status.done:
-        status = translator.translate_document_get_status(handle)
+    def check_status_fields(status):
         assert (
             status.status == deepl.DocumentStatus.Status.QUEUED
             or status.seconds_remaining >= 0
         )
-        time.sleep(0.2)
+
+    status = _wait_until_done(
+        translator, handle, on_status=check_status_fields
+    )
+    assert status.ok
 
     with open(output_document_path, "wb") as outfile:
         translator.translate_document_download(handle, outfile)
 
     time_after = time.time()
-    assert status.billed_characters == len(example_document_path.read_text())
+    # The example document contains exactly the example text, so its length
+    # is known without re-reading the file
+    assert status.billed_characters == len(example_text["EN"])
     assert time_after - time_before > 4.0
     assert example_text["DE"] == output_document_path.read_text()
 
@@ -282,26 +290,24 @@ def test_translate_document_download_generator(
     translator,
     example_large_document_path,
     output_document_path,
-    example_large_document_translation,
+    example_large_document_translation_bytes,
 ):
     with open(example_large_document_path, "rb") as infile:
         handle = translator.translate_document_upload(
             infile, **default_lang_args
         )
 
-    status = translator.translate_document_get_status(handle)
-    while status.ok and not status.done:
-        status = translator.translate_document_get_status(handle)
-        time.sleep(0.2)
+    status = _wait_until_done(translator, handle)
 
     assert status.ok and status.done
     response = translator.translate_document_download(handle)
     with open(output_document_path, "wb") as outfile:
-        for chunk in response.iter_content(chunk_size=128):
+        for chunk in response.iter_content(chunk_size=65536):
             outfile.write(chunk)
 
     assert (
-        output_document_path.read_text() == example_large_document_translation
+        output_document_path.read_bytes()
+        == example_large_document_translation_bytes
     )
 
 
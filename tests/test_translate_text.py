@@ -6,15 +6,23 @@ from .conftest import example_text, needs_mock_server, needs_real_server
 import deepl
 import pytest
 import re
-import time
+
+example_text_en = example_text["EN"]
+example_text_de = example_text["DE"]
+example_text_fr = example_text["FR"]
+example_text_en_us = example_text["EN-US"]
+
+# Expected translated title in the XML tag-handling test; compiled once
+# for the module
+title_regex = re.compile("<title>.*Der Titel.*</title>")
 
 
 def test_single_text(translator):
-    result = translator.translate_text(example_text["EN"], target_lang="DE")
-    assert example_text["DE"] == result.text
+    result = translator.translate_text(example_text_en, target_lang="DE")
+    assert example_text_de == result.text
     assert "EN" == result.detected_source_lang
-    assert example_text["DE"] == str(result)
-    assert result.billed_characters == len(example_text["EN"])
+    assert example_text_de == str(result)
+    assert result.billed_characters == len(example_text_en)
 
 
 @pytest.mark.parametrize(
@@ -23,7 +31,7 @@ def test_single_text(translator):
 )
 def test_model_type(translator, model_type):
     result = translator.translate_text(
-        example_text["EN"], target_lang="DE", model_type=model_type
+        example_text_en, target_lang="DE", model_type=model_type
     )
     # TODO: use `removeprefix()` when we only support py3.8+
     expected_model_type = str(model_type)
@@ -36,98 +44,116 @@ def test_model_type(translator, model_type):
 
 
 def test_string_list(translator):
-    texts = [example_text["FR"], example_text["EN"]]
+    texts = [example_text_fr, example_text_en]
     result = translator.translate_text(texts, target_lang="DE")
-    assert example_text["DE"] == result[0].text
-    assert example_text["DE"] == result[1].text
+    assert example_text_de == result[0].text
+    assert example_text_de == result[1].text
 
 
 def test_string_generator(translator):
     def gen():
-        yield example_text["EN"]
-        yield example_text["EN"]
-        yield example_text["EN"]
+        yield example_text_en
+        yield example_text_en
+        yield example_text_en
 
     result = translator.translate_text(gen(), target_lang="DE")
-    assert [example_text["DE"]] * 3 == [r.text for r in result]
+    assert [example_text_de] * 3 == [r.text for r in result]
     assert ["EN"] * 3 == [r.detected_source_lang for r in result]
 
 
-def test_source_lang(translator):
+def test_source_lang(translator, source_languages):
     def check_result(result):
-        assert result.text == example_text["DE"]
+        assert result.text == example_text_de
         assert result.detected_source_lang == "EN"
 
-    check_result(
-        translator.translate_text(example_text["EN"], target_lang="DE")
-    )
+    check_result(translator.translate_text(example_text_en, target_lang="DE"))
     check_result(
         translator.translate_text(
-            example_text["EN"], source_lang="En", target_lang="DE"
+            example_text_en, source_lang="En", target_lang="DE"
         )
     )
     check_result(
         translator.translate_text(
-            example_text["EN"], source_lang="en", target_lang="DE"
+            example_text_en, source_lang="en", target_lang="DE"
         )
     )
 
-    source_languages = translator.get_source_languages()
     source_language_en = next(
         language for language in source_languages if language.code == "EN"
     )
     check_result(
         translator.translate_text(
-            example_text["EN"],
+            example_text_en,
             source_lang=source_language_en,
             target_lang="DE",
         )
     )
 
 
-def test_target_lang(translator):
+def test_target_lang(translator, target_languages):
     def check_result(result):
-        assert result.text == example_text["DE"]
+        assert result.text == example_text_de
         assert result.detected_source_lang == "EN"
 
-    check_result(
-        translator.translate_text(example_text["EN"], target_lang="De")
-    )
-    check_result(
-        translator.translate_text(example_text["EN"], target_lang="de")
-    )
+    check_result(translator.translate_text(example_text_en, target_lang="De"))
+    check_result(translator.translate_text(example_text_en, target_lang="de"))
 
-    target_languages = translator.get_target_languages()
     target_language_de = next(
         language for language in target_languages if language.code == "DE"
     )
     check_result(
         translator.translate_text(
-            example_text["EN"],
+            example_text_en,
             target_lang=target_language_de,
         )
     )
 
-    with pytest.raises(deepl.DeepLException, match="deprecated"):
-        translator.translate_text(example_text["DE"], target_lang="EN")
-    with pytest.raises(deepl.DeepLException, match="deprecated"):
-        translator.translate_text(example_text["DE"], target_lang="PT")
 
-
-def test_invalid_language(translator):
-    with pytest.raises(
-        deepl.DeepLException,
-        match="target_lang.*not supported",
-    ):
-        translator.translate_text(example_text["EN"], target_lang="XX")
-
-    with pytest.raises(
-        deepl.DeepLException,
-        match="source_lang.*not supported",
-    ):
-        translator.translate_text(
-            example_text["EN"], source_lang="XX", target_lang="DE"
-        )
+@pytest.mark.parametrize(
+    "kwargs,exception,match",
+    [
+        (
+            {"text": example_text_en, "target_lang": "XX"},
+            deepl.DeepLException,
+            "target_lang.*not supported",
+        ),
+        (
+            {
+                "text": example_text_en,
+                "source_lang": "XX",
+                "target_lang": "DE",
+            },
+            deepl.DeepLException,
+            "source_lang.*not supported",
+        ),
+        (
+            {"text": example_text_de, "target_lang": "EN"},
+            deepl.DeepLException,
+            "deprecated",
+        ),
+        (
+            {"text": example_text_de, "target_lang": "PT"},
+            deepl.DeepLException,
+            "deprecated",
+        ),
+        ({"text": 123, "target_lang": "DE"}, TypeError, "text parameter"),
+        ({"target_lang": "DE"}, TypeError, None),
+        ({"text": "", "target_lang": "DE"}, ValueError, ".*empty.*"),
+    ],
+    ids=[
+        "invalid-target-lang",
+        "invalid-source-lang",
+        "deprecated-target-en",
+        "deprecated-target-pt",
+        "invalid-text-type",
+        "missing-text",
+        "empty-text",
+    ],
+)
+def test_translate_text_errors(translator, kwargs, exception, match):
+    # Invalid arguments are rejected before any translation is attempted
+    with pytest.raises(exception, match=match):
+        translator.translate_text(**kwargs)
 
 
 def test_skip_language_check(server):
@@ -135,123 +161,105 @@ def test_skip_language_check(server):
         server.auth_key, server_url=server.server_url, skip_language_check=True
     )
     with pytest.raises(deepl.DeepLException, match="target_lang"):
-        translator.translate_text(example_text["EN"], target_lang="XX")
+        translator.translate_text(example_text_en, target_lang="XX")
     with pytest.raises(deepl.DeepLException, match="source_lang"):
         translator.translate_text(
-            example_text["EN"], source_lang="XX", target_lang="DE"
+            example_text_en, source_lang="XX", target_lang="DE"
         )
 
 
-def test_invalid_text(translator):
-    with pytest.raises(TypeError, match="text parameter"):
-        translator.translate_text(123, target_lang="DE")
-    with pytest.raises(TypeError):
-        translator.translate_text(target_lang="DE")
-
-
 @needs_mock_server
-def test_translate_with_retries(translator, server):
+def test_translate_with_retries(translator, server, monkeypatch):
     server.respond_with_429(2)
-    time_before = time.time()
-    result = translator.translate_text(example_text["EN"], target_lang="DE")
-    time_after = time.time()
-    assert example_text["DE"] == result.text
-    assert "EN" == result.detected_source_lang
-    assert time_after - time_before > 1.0
-
+    # Record the backoff sleeps instead of waiting through them, so the
+    # retry schedule is asserted without real delay
+    sleeps = []
+    monkeypatch.setattr(deepl.http_client.time, "sleep", sleeps.append)
 
-def test_formality(translator, server):
-    input_text = "How are you?"
-    informal = "Wie geht es dir?"
-    formal = "Wie geht es Ihnen?"
-
-    result = translator.translate_text(
-        input_text, target_lang="DE", formality=deepl.Formality.LESS
-    )
-    if not server.is_mock_server:
-        assert informal == result.text
-    result = translator.translate_text(
-        input_text, target_lang="DE", formality=deepl.Formality.DEFAULT
-    )
-    if not server.is_mock_server:
-        assert formal == result.text
-    result = translator.translate_text(
-        input_text, target_lang="DE", formality=deepl.Formality.MORE
-    )
-    if not server.is_mock_server:
-        assert formal == result.text
+    result = translator.translate_text(example_text_en, target_lang="DE")
+    assert example_text_de == result.text
+    assert "EN" == result.detected_source_lang
+    # Both 429 responses must be followed by a backoff wait
+    assert len(sleeps) == 2
+    assert all(duration >= 0.0 for duration in sleeps)
 
-    # Specifying formality as string is also permitted
-    result = translator.translate_text(
-        input_text, target_lang="DE", formality="less"
-    )
-    if not server.is_mock_server:
-        assert informal == result.text
 
-    result = translator.translate_text(
-        input_text, target_lang="DE", formality="default"
-    )
-    if not server.is_mock_server:
-        assert formal == result.text
+formality_input_text = "How are you?"
+formality_informal = "Wie geht es dir?"
+formality_formal = "Wie geht es Ihnen?"
 
-    result = translator.translate_text(
-        input_text, target_lang="DE", formality="more"
-    )
-    if not server.is_mock_server:
-        assert formal == result.text
 
-    # formality parameter is case-insensitive
+@pytest.mark.parametrize(
+    "formality,expected",
+    [
+        (deepl.Formality.LESS, formality_informal),
+        (deepl.Formality.DEFAULT, formality_formal),
+        (deepl.Formality.MORE, formality_formal),
+        # Specifying formality as string is also permitted, and the
+        # formality parameter is case-insensitive
+        ("less", formality_informal),
+        ("default", formality_formal),
+        ("more", formality_formal),
+        ("Less", formality_informal),
+        (deepl.Formality.PREFER_LESS, formality_informal),
+        (deepl.Formality.PREFER_MORE, formality_formal),
+    ],
+    ids=[
+        "enum-less",
+        "enum-default",
+        "enum-more",
+        "string-less",
+        "string-default",
+        "string-more",
+        "string-mixed-case",
+        "enum-prefer-less",
+        "enum-prefer-more",
+    ],
+)
+def test_formality(translator, server, formality, expected):
     result = translator.translate_text(
-        input_text, target_lang="DE", formality="Less"
+        formality_input_text, target_lang="DE", formality=formality
     )
     if not server.is_mock_server:
-        assert informal == result.text
+        assert expected == result.text
 
-    with pytest.raises(deepl.DeepLException, match=r".*formality.*"):
-        _ = translator.translate_text(
-            input_text, target_lang="DE", formality="invalid"
-        )
 
-    with pytest.raises(
-        deepl.DeepLException, match=r".*formality.*target_lang.*"
-    ):
+@pytest.mark.parametrize(
+    "target_lang,formality,match",
+    [
+        ("DE", "invalid", r".*formality.*"),
+        ("EN-US", "more", r".*formality.*target_lang.*"),
+        ("TR", "more", r".*formality.*target_lang.*"),
+    ],
+    ids=["invalid-value", "unsupported-en-us", "unsupported-tr"],
+)
+def test_formality_invalid(translator, target_lang, formality, match):
+    with pytest.raises(deepl.DeepLException, match=match):
         _ = translator.translate_text(
-            "Test", target_lang="EN-US", formality="more"
+            formality_input_text,
+            target_lang=target_lang,
+            formality=formality,
         )
 
-    result = translator.translate_text(
-        input_text, target_lang="DE", formality=deepl.Formality.PREFER_LESS
-    )
-    if not server.is_mock_server:
-        assert informal == result.text
 
-    result = translator.translate_text(
-        input_text, target_lang="DE", formality=deepl.Formality.PREFER_MORE
-    )
-    if not server.is_mock_server:
-        assert formal == result.text
-
-    # Using prefer_ * with a language that does not support formality is not
+def test_formality_prefer_unsupported_lang(translator):
+    # Using prefer_* with a language that does not support formality is not
     # an error
     translator.translate_text(
-        input_text, target_lang="TR", formality=deepl.Formality.PREFER_MORE
+        formality_input_text,
+        target_lang="TR",
+        formality=deepl.Formality.PREFER_MORE,
     )
-    with pytest.raises(
-        deepl.DeepLException, match=r".*formality.*target_lang.*"
-    ):
-        _ = translator.translate_text(
-            input_text, target_lang="TR", formality="more"
-        )
 
 
 def test_preserve_formatting(translator):
     # Note: this test may use the mock server that will not translate the text,
     # therefore we do not check the translated result.
     _ = translator.translate_text(
-        example_text["EN"], target_lang="DE", preserve_formatting=True
+        example_text_en, target_lang="DE", preserve_formatting=True
     )
     _ = translator.translate_text(
-        example_text["EN"], target_lang="DE", preserve_formatting=False
+        example_text_en, target_lang="DE", preserve_formatting=False
     )
 
 
@@ -343,7 +351,7 @@ def test_tag_handling_xml(translator):
     )
 
     assert "<raw>This sentence will not be translated.</raw>" in result.text
-    assert re.compile("<title>.*Der Titel.*</title>").search(result.text)
+    assert title_regex.search(result.text)
 
 
 @needs_real_server
@@ -378,28 +386,23 @@ def test_invalid_auth_key(server):
         translator.translate_text("Hello, world!", target_lang="DE")
 
 
-def test_empty_text(translator):
-    with pytest.raises(ValueError, match=r".*empty.*"):
-        translator.translate_text("", target_lang="DE")
-
-
 def test_mixed_case_languages(translator):
-    result = translator.translate_text(example_text["DE"], target_lang="en-us")
-    assert example_text["EN-US"] == result.text.lower()
+    result = translator.translate_text(example_text_de, target_lang="en-us")
+    assert example_text_en_us == result.text.lower()
     assert "DE" == result.detected_source_lang
 
-    result = translator.translate_text(example_text["DE"], target_lang="EN-us")
-    assert example_text["EN-US"] == result.text.lower()
+    result = translator.translate_text(example_text_de, target_lang="EN-us")
+    assert example_text_en_us == result.text.lower()
     assert "DE" == result.detected_source_lang
 
     result = translator.translate_text(
-        example_text["DE"], source_lang="de", target_lang="EN-US"
+        example_text_de, source_lang="de", target_lang="EN-US"
     )
-    assert example_text["EN-US"] == result.text.lower()
+    assert example_text_en_us == result.text.lower()
     assert "DE" == result.detected_source_lang
 
     result = translator.translate_text(
-        example_text["DE"], source_lang="dE", target_lang="EN-US"
+        example_text_de, source_lang="dE", target_lang="EN-US"
     )
-    assert example_text["EN-US"] == result.text.lower()
+    assert example_text_en_us == result.text.lower()
     assert "DE" == result.detected_source_lang